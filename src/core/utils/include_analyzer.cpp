@@ -87,6 +87,12 @@ std::vector<std::string> include_analyzer::parse_includes(const std::filesystem:
 
   std::string line;
   while (std::getline(file, line)) {
+    // Cheap prefilter: only lines containing '#' can match, so skip the
+    // (comparatively slow) std::regex search for everything else
+    if (line.find('#') == std::string::npos) {
+      continue;
+    }
+
     std::smatch match;
     if (std::regex_search(line, match, include_regex)) {
       includes.push_back(match[1].str());
@@ -133,10 +139,23 @@ std::map<std::string, std::vector<std::string>> include_analyzer::build_include_
 
   // Find all source files in project
   try {
-    for (auto &entry : std::filesystem::recursive_directory_iterator(project_dir_)) {
-      if (entry.is_regular_file() && has_valid_extension(entry.path())
-          && !is_excluded(entry.path())) {
-        to_process.push_back(entry.path());
+    std::error_code ec;
+    for (auto it = std::filesystem::recursive_directory_iterator(
+             project_dir_, std::filesystem::directory_options::skip_permission_denied, ec);
+         !ec && it != std::filesystem::recursive_directory_iterator();
+         it.increment(ec)) {
+      // Prune excluded directories (build, vendor, ...) instead of walking
+      // their whole subtree only to reject every file inside
+      std::error_code entry_ec;
+      if (it->is_directory(entry_ec)) {
+        if (is_excluded(it->path())) {
+          it.disable_recursion_pending();
+        }
+        continue;
+      }
+      if (it->is_regular_file(entry_ec) && has_valid_extension(it->path())
+          && !is_excluded(it->path())) {
+        to_process.push_back(it->path());
       }
     }
   } catch (...) {